@@ -1,13 +1,27 @@
 import os
+import threading
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable
 
+from core import tag_cache
 from core.rt_audio_engine import RealTimeAudioEngine, TrackInfo
 from mutagen._file import File as MutagenFile
+from tinytag import TinyTag
 
 
-@dataclass
+_SKIP_SEEK_DEBOUNCE_S = 0.15
+
+_TITLE_KEYS = {key: rank for rank, key in enumerate(("TIT2", "\xa9nam", "title"))}
+_ARTIST_KEYS = {
+    key: rank
+    for rank, key in enumerate(("TPE1", "\xa9ART", "aART", "artist", "TPE2", "albumartist"))
+}
+_ALBUM_KEYS = {key: rank for rank, key in enumerate(("TALB", "\xa9alb", "album"))}
+
+
+@dataclass(slots=True)
 class UIState:
+    path: str | None = None
     title: str = "No file loaded"
     artist: str = ""
     album: str = ""
@@ -18,6 +32,8 @@ class UIState:
     is_paused: bool = False
 
     cover_bytes: bytes | None = None
+    meta_version: int = 0
+    meta_pending: bool = False
 
     tempo: float = 1.0
     semitones: float = 0.0
@@ -26,23 +42,42 @@ class UIState:
     is_applying_fx: bool = False
     fx_message: str = ""
 
+    # Bumped whenever a displayed field other than title/cover/position changes.
+    view_version: int = 0
+
 
 class PlayerController:
     def __init__(self, engine: RealTimeAudioEngine):
         self.engine = engine
         self.state = UIState()
         self._path: str | None = None
+        self._meta_lock = threading.Lock()
+        self._meta_cancel: threading.Event | None = None
+
+        self._seek_lock = threading.Lock()
+        self._seek_timer: threading.Timer | None = None
+        self._pending_seek_s: float | None = None
 
         self.engine.set_volume(self.state.volume)
 
     def load(self, path: str) -> None:
+        self._cancel_pending_seek()
         track: TrackInfo = self.engine.load(path)
-        self._path = path
-        meta_title, artist, album = _extract_metadata(path)
 
-        self.state.title = meta_title or os.path.basename(track.path)
-        self.state.artist = artist
-        self.state.album = album
+        cancel = threading.Event()
+        with self._meta_lock:
+            if self._meta_cancel is not None:
+                self._meta_cancel.set()
+            self._meta_cancel = cancel
+            self._path = path
+            self.state.title = os.path.basename(track.path)
+            self.state.artist = ""
+            self.state.album = ""
+            self.state.cover_bytes = None
+            self.state.meta_pending = True
+            self.state.meta_version += 1
+
+        self.state.path = path
         self.state.duration_s = track.duration_s
         self.state.pos_s = 0.0
         self.state.is_loaded = True
@@ -54,19 +89,22 @@ class PlayerController:
         self.engine.set_tempo(1.0)
         self.engine.set_pitch_semitones(0.0)
 
-        self.state.cover_bytes = _extract_cover_bytes(path)
-
         self.state.is_applying_fx = False
         self._update_fx_message()
         self.engine.set_volume(self.state.volume)
+        self.state.view_version += 1
+
+        threading.Thread(target=self._finish_load, args=(path, cancel), daemon=True).start()
 
     def play(self) -> None:
         if not self.state.is_loaded:
             return
 
         if self.engine.is_playing() and self.engine.is_paused():
+            self._flush_pending_seek()
             self.engine.unpause()
         else:
+            self._cancel_pending_seek()
             if self._is_at_end():
                 self.state.pos_s = 0.0
             self.engine.seek(self.state.pos_s)
@@ -92,6 +130,7 @@ class PlayerController:
             return
 
         if self.engine.is_paused():
+            self._flush_pending_seek()
             self.engine.unpause()
         else:
             self.engine.pause()
@@ -102,6 +141,7 @@ class PlayerController:
         if not self.state.is_loaded:
             return
 
+        self._cancel_pending_seek()
         self.engine.stop()
         self.state.pos_s = 0.0
         self._sync()
@@ -110,12 +150,8 @@ class PlayerController:
         if not self.state.is_loaded:
             return
 
-        pos_s = float(pos_s)
-        if self.state.duration_s > 0:
-            pos_s = max(0.0, min(pos_s, self.state.duration_s))
-        else:
-            pos_s = max(0.0, pos_s)
-
+        pos_s = self._clamp_pos(pos_s)
+        self._cancel_pending_seek()
         self.engine.seek(pos_s)
         self.state.pos_s = pos_s
         self._sync()
@@ -123,7 +159,19 @@ class PlayerController:
     def skip(self, delta_s: float) -> None:
         if not self.state.is_loaded:
             return
-        self.seek(self.state.pos_s + float(delta_s))
+
+        pos_s = self._clamp_pos(self.state.pos_s + float(delta_s))
+        self.state.pos_s = pos_s
+
+        with self._seek_lock:
+            if self._seek_timer is not None:
+                self._seek_timer.cancel()
+            self._pending_seek_s = pos_s
+            self._seek_timer = threading.Timer(_SKIP_SEEK_DEBOUNCE_S, self._flush_pending_seek)
+            self._seek_timer.daemon = True
+            self._seek_timer.start()
+
+        self._sync()
 
     def set_tempo(self, tempo: float) -> None:
         tempo = float(max(0.5, min(2.0, tempo)))
@@ -162,29 +210,91 @@ class PlayerController:
             v = 1.0
         self.state.volume = v
         self.engine.set_volume(v)
+        self.state.view_version += 1
 
     def tick(self) -> None:
         if not self.state.is_loaded:
             return
+        if self._pending_seek_s is not None:
+            self._sync()
+            return
 
-        pos = self.engine.get_pos_s()
+        pos, is_playing, is_paused = self.engine.snapshot()
         dur = self.state.duration_s
         if dur > 0:
             pos = max(0.0, min(pos, dur))
         self.state.pos_s = pos
-
-        self._sync()
+        self._set_transport(is_playing, is_paused)
 
     def shutdown(self) -> None:
+        self._cancel_pending_seek()
         self.engine.shutdown()
 
+    def _finish_load(self, path: str, cancel: threading.Event) -> None:
+        tags = None
+        try:
+            if cancel.is_set():
+                return
+
+            tags = tag_cache.get(path)
+            if tags is None:
+                if cancel.is_set():
+                    return
+                tags = _read_tags(path)
+                tag_cache.put(path, tags)
+        finally:
+            with self._meta_lock:
+                # A superseded load leaves the flag to the load that replaced it.
+                if not cancel.is_set():
+                    if tags is not None:
+                        if tags.title:
+                            self.state.title = tags.title
+                        self.state.artist = tags.artist
+                        self.state.album = tags.album
+                        self.state.cover_bytes = tags.cover
+                    self.state.meta_pending = False
+                    self.state.meta_version += 1
+
+    def _flush_pending_seek(self) -> None:
+        with self._seek_lock:
+            if self._seek_timer is not None:
+                self._seek_timer.cancel()
+                self._seek_timer = None
+            pos_s = self._pending_seek_s
+            if pos_s is not None:
+                # Keep the pending marker until the engine has the new position, so
+                # tick() doesn't copy the pre-seek position back into state.pos_s.
+                self.engine.seek(pos_s)
+                self._pending_seek_s = None
+
+    def _cancel_pending_seek(self) -> None:
+        with self._seek_lock:
+            if self._seek_timer is not None:
+                self._seek_timer.cancel()
+                self._seek_timer = None
+            self._pending_seek_s = None
+
+    def _clamp_pos(self, pos_s: float) -> float:
+        pos_s = float(pos_s)
+        if self.state.duration_s > 0:
+            return max(0.0, min(pos_s, self.state.duration_s))
+        return max(0.0, pos_s)
+
     def _sync(self) -> None:
-        self.state.is_playing = self.engine.is_playing()
-        self.state.is_paused = self.engine.is_paused()
+        _pos, is_playing, is_paused = self.engine.snapshot()
+        self._set_transport(is_playing, is_paused)
+
+    def _set_transport(self, is_playing: bool, is_paused: bool) -> None:
+        st = self.state
+        if st.is_playing != is_playing or st.is_paused != is_paused:
+            st.is_playing = is_playing
+            st.is_paused = is_paused
+            st.view_version += 1
 
     def _update_fx_message(self) -> None:
         sign = "+" if self.state.semitones >= 0 else ""
         self.state.fx_message = f"Tempo {self.state.tempo:.2f}x | Pitch {sign}{self.state.semitones:.0f} st"
+        self.state.view_version += 1
 
     def _is_at_end(self) -> bool:
         if self.state.duration_s <= 0:
@@ -192,87 +302,158 @@ class PlayerController:
         return self.state.pos_s >= (self.state.duration_s - 0.05)
 
 
-def _extract_metadata(path: str) -> tuple[str | None, str, str]:
+def _mfile(path: str) -> Any:
+    with open(path, "rb", buffering=4096) as fh:
+        return MutagenFile(fh)
+
+
+@dataclass(frozen=True, slots=True)
+class _TagBundle:
+    title: str | None = None
+    artist: str = ""
+    album: str = ""
+    cover: bytes | None = None
+    cover_state: int = tag_cache.COVER_UNKNOWN
+
+
+def _read_tags(path: str) -> _TagBundle:
     title: str | None = None
     artist = ""
     album = ""
+    cover: bytes | None = None
+    parsed = False
 
+    # Only the parse is guarded: field access errors (e.g. an API mismatch) must not
+    # be mistaken for "no cover" and cached as such.
     try:
-        audio_easy = MutagenFile(path, easy=True)
-        tags = getattr(audio_easy, "tags", None)
-        if tags:
-            title = _first_text(tags.get("title"))
-            artist = (
-                _first_text(tags.get("artist"))
-                or _first_text(tags.get("albumartist"))
-                or ""
-            )
-            album = _first_text(tags.get("album")) or ""
+        tag = TinyTag.get(path, image=True)
     except Exception:
-        pass
-
-    if title and artist and album:
-        return title, artist, album
+        tag = None
+
+    if tag is not None:
+        parsed = True
+        title = _first_text(tag.title)
+        artist = _first_text(tag.artist) or _first_text(tag.albumartist) or ""
+        album = _first_text(tag.album) or ""
+        image = tag.images.any
+        if image is not None and image.data:
+            cover = image.data
+
+    if not (parsed and title and artist and album):
+        try:
+            audio = _mfile(path)
+        except Exception:
+            audio = None
+
+        if audio is not None:
+            meta_title, meta_artist, meta_album = _extract_metadata(audio)
+            title = title or meta_title
+            artist = artist or meta_artist
+            album = album or meta_album
+            if cover is None:
+                cover = _extract_cover_bytes(audio)
+            parsed = True
+
+    if cover:
+        cover_state = tag_cache.COVER_PRESENT
+    elif parsed:
+        cover_state = tag_cache.COVER_ABSENT
+    else:
+        cover_state = tag_cache.COVER_UNKNOWN
+
+    return _TagBundle(
+        title=title, artist=artist, album=album, cover=cover, cover_state=cover_state
+    )
+
+
+def _extract_metadata(audio: Any) -> tuple[str | None, str, str]:
+    tags = getattr(audio, "tags", None)
+    if not tags:
+        return None, "", ""
 
     try:
-        audio_full = MutagenFile(path)
-        tags = getattr(audio_full, "tags", None)
-        if tags:
-            if not title:
-                title = _pick_tag_text(tags, ("TIT2", "\xa9nam", "title"))
-            if not artist:
-                artist = _pick_tag_text(tags, ("TPE1", "\xa9ART", "aART", "artist")) or ""
-            if not album:
-                album = _pick_tag_text(tags, ("TALB", "\xa9alb", "album")) or ""
+        title = _pick_tag_text(tags, _TITLE_KEYS)
+        artist = _pick_tag_text(tags, _ARTIST_KEYS) or ""
+        album = _pick_tag_text(tags, _ALBUM_KEYS) or ""
     except Exception:
-        pass
+        return None, "", ""
 
     return title, artist, album
 
 
-def _pick_tag_text(tags: Any, keys: tuple[str, ...]) -> str | None:
-    for key in keys:
-        try:
-            value = tags.get(key)
-        except Exception:
-            value = None
-        text = _first_text(value)
+def _pick_tag_text(tags: Any, ranks: dict[str, int]) -> str | None:
+    best: str | None = None
+    best_rank = len(ranks)
+    for key in tags.keys():
+        rank = ranks.get(key)
+        if rank is None and isinstance(key, str):
+            # APEv2 (and some other containers) keep keys as written, e.g. "Title".
+            rank = ranks.get(key.lower())
+        if rank is None or rank >= best_rank:
+            continue
+        text = _first_text(tags[key])
         if text:
-            return text
-    return None
+            best, best_rank = text, rank
+            if rank == 0:
+                break
+    return best
 
 
 def _first_text(value: Any) -> str | None:
     if value is None:
         return None
 
-    if isinstance(value, (list, tuple)):
-        for item in value:
-            text = _first_text(item)
-            if text:
-                return text
+    handler = _TEXT_HANDLERS.get(type(value))
+    if handler is not None:
+        return handler(value)
+    return _text_from_object(value)
+
+
+def _text_from_seq(value: Any) -> str | None:
+    for item in value:
+        text = _first_text(item)
+        if text:
+            return text
+    return None
+
+
+def _text_from_bytes(value: Any) -> str | None:
+    try:
+        text = bytes(value).decode("utf-8", errors="ignore").strip()
+    except Exception:
         return None
+    return text or None
+
+
+def _text_from_str(value: str) -> str | None:
+    text = value.strip()
+    return text or None
+
+
+def _text_from_object(value: Any) -> str | None:
+    if isinstance(value, (list, tuple)):
+        return _text_from_seq(value)
 
     if hasattr(value, "text"):
         return _first_text(getattr(value, "text"))
 
     if isinstance(value, (bytes, bytearray)):
-        try:
-            text = bytes(value).decode("utf-8", errors="ignore").strip()
-        except Exception:
-            return None
-        return text or None
+        return _text_from_bytes(value)
 
-    text = str(value).strip()
-    return text or None
+    return _text_from_str(str(value))
 
 
-def _extract_cover_bytes(path: str) -> bytes | None:
-    try:
-        audio = MutagenFile(path)
-        if audio is None:
-            return None
+_TEXT_HANDLERS: dict[type, Callable[[Any], str | None]] = {
+    list: _text_from_seq,
+    tuple: _text_from_seq,
+    bytes: _text_from_bytes,
+    bytearray: _text_from_bytes,
+    str: _text_from_str,
+}
+
 
+def _extract_cover_bytes(audio: Any) -> bytes | None:
+    try:
         if audio.tags:
             for key in audio.tags.keys():
                 if key.startswith("APIC"):
@@ -0,0 +1,22 @@
+import os
+import sys
+
+
+_APP_DIR_NAME = "OfflineMusicPlayer"
+
+
+def user_cache_dir(*parts: str) -> str:
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+        base = os.path.join(base, _APP_DIR_NAME, "Cache")
+    elif sys.platform == "darwin":
+        base = os.path.join(os.path.expanduser("~/Library/Caches"), _APP_DIR_NAME)
+    else:
+        base = os.path.join(
+            os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+            _APP_DIR_NAME,
+        )
+
+    path = os.path.join(base, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
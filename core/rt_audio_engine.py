@@ -1,24 +1,47 @@
+import functools
+import math
+import queue
 import subprocess
 import threading
 import traceback
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Optional
-from collections import deque
+from typing import Callable, Optional
 import numpy as np
 import sounddevice as sd
 import soundfile as sf
+import soxr
 import pylibrb
 from pylibrb import RubberBandStretcher, Option
 import sys
 import os
 
 
-@dataclass
+_RING_BLOCKS = 8
+_PRODUCER_IDLE_S = 0.005
+_PIPE_BUFSIZE = 1024 * 1024
+_PCM_INITIAL_SAMPLES = 48000 * 2 * 60
+_MAX_PROCESS_FRAMES = 8192
+_LOG_QUEUE_MAX = 256
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+# libsndfile doesn't rescale float-encoded files when reading them as int16.
+_SF_FLOAT_SUBTYPES = frozenset({"FLOAT", "DOUBLE"})
+
+# Recently decoded tracks, keyed by (abspath, mtime_ns, size, sr, channels) and
+# bounded by total bytes, so skipping back to a track doesn't decode it again.
+_DECODE_CACHE_MAX_BYTES = 500 * 1024 * 1024
+_DECODE_CACHE: OrderedDict[tuple, tuple[np.ndarray, int]] = OrderedDict()
+_DECODE_CACHE_LOCK = threading.Lock()
+_decode_cache_bytes = 0
+
+
+@dataclass(slots=True)
 class TrackInfo:
     path: str
     duration_s: float
     sample_rate: int
     channels: int
+    frames: int
 
 
 def _load_any_audio_ffmpeg(
@@ -27,59 +50,199 @@ def _load_any_audio_ffmpeg(
     target_channels: int = 2,
 ) -> tuple[np.ndarray, int]:
 
+    # Opening the file is the probe: anything soundfile can't read goes to ffmpeg.
     try:
-        data, sr = sf.read(path, always_2d=True, dtype="float32")
+        with sf.SoundFile(path) as f:
+            sr = f.samplerate
+            if f.subtype in _SF_FLOAT_SUBTYPES:
+                data = _quantize_int16(f.read(dtype="float32", always_2d=True))
+            else:
+                data = f.read(dtype="int16", always_2d=True)
+    except Exception:
+        data = None
 
+    if data is not None:
+        # Match ffmpeg's -ac: the output stream keeps one channel count for the
+        # session. Downmix before resampling and upmix after, to resample less.
+        if data.shape[1] > target_channels:
+            data = _remix_int16(data, target_channels)
         if int(sr) != int(target_sr):
-            raise RuntimeError("Needs resample; fallback to ffmpeg")
-
-        return np.ascontiguousarray(data, dtype=np.float32), int(sr)
-    except Exception:
-        pass
+            data = soxr.resample(data, int(sr), int(target_sr), quality="HQ")
+        if data.shape[1] != target_channels:
+            data = _remix_int16(data, target_channels)
+        return np.ascontiguousarray(data, dtype=np.int16), int(target_sr)
 
     cmd = [
         _ffmpeg_exe(),
         "-hide_banner",
+        "-nostdin",
         "-loglevel", "error",
         "-i", path,
-        "-f", "f32le",
-        "-acodec", "pcm_f32le",
+        "-vn", "-sn", "-dn",
+        "-f", "s16le",
+        "-acodec", "pcm_s16le",
         "-ac", str(int(target_channels)),
         "-ar", str(int(target_sr)),
         "pipe:1",
     ]
 
     try:
-        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=_PIPE_BUFSIZE,
+        )
     except FileNotFoundError:
         raise RuntimeError("ffmpeg not found. Install ffmpeg and ensure it is in PATH.")
 
-    out, err = proc.communicate()
+    err_chunks: list[bytes] = []
+    err_reader = threading.Thread(
+        target=lambda: err_chunks.append(proc.stderr.read()), daemon=True
+    )
+    err_reader.start()
+
+    try:
+        audio = _read_pcm(proc.stdout)
+    finally:
+        proc.stdout.close()
+        proc.wait()
+        err_reader.join()
+
     if proc.returncode != 0:
+        err = b"".join(err_chunks)
         msg = err.decode(errors="replace").strip() if err else "ffmpeg decode failed"
         raise RuntimeError(f"ffmpeg failed: {msg}")
 
-    audio = np.frombuffer(out, dtype=np.float32)
     if audio.size == 0:
         raise RuntimeError("ffmpeg produced no audio samples.")
 
     if audio.size % target_channels != 0:
         audio = audio[: audio.size - (audio.size % target_channels)]
 
-    audio = audio.reshape((-1, target_channels))
-    return np.ascontiguousarray(audio, dtype=np.float32), int(target_sr)
+    return audio.reshape((-1, target_channels)), int(target_sr)
+
+
+# Stereo downmix roles for the standard WAV/FLAC channel orders:
+# L/R go to their side, C to both at -3 dB, "-" (LFE) is dropped.
+_STEREO_DOWNMIX_ROLES = {
+    3: "LRC",
+    4: "LRLR",
+    5: "LRCLR",
+    6: "LRC-LR",
+    7: "LRC-CLR",
+    8: "LRC-LRLR",
+}
+_STEREO_ROLE_GAINS = {
+    "L": (1.0, 0.0),
+    "R": (0.0, 1.0),
+    "C": (math.sqrt(0.5), math.sqrt(0.5)),
+    "-": (0.0, 0.0),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _channel_mix_matrix(src_channels: int, dst_channels: int) -> np.ndarray:
+    if src_channels == 1:
+        mix = np.ones((1, dst_channels), dtype=np.float32)
+    elif dst_channels == 1:
+        mix = np.full((src_channels, 1), 1.0 / src_channels, dtype=np.float32)
+    elif dst_channels == 2 and src_channels in _STEREO_DOWNMIX_ROLES:
+        roles = _STEREO_DOWNMIX_ROLES[src_channels]
+        mix = np.array([_STEREO_ROLE_GAINS[r] for r in roles], dtype=np.float32)
+    else:
+        mix = np.zeros((src_channels, dst_channels), dtype=np.float32)
+        mix[np.arange(src_channels), np.arange(src_channels) % dst_channels] = 1.0
+
+    # Normalise like ffmpeg's default so a full-scale downmix can't clip.
+    col_sums = mix.sum(axis=0)
+    mix /= np.maximum(col_sums, 1.0)
+    mix.flags.writeable = False
+    return mix
+
+
+def _quantize_int16(data: np.ndarray) -> np.ndarray:
+    data = data * np.float32(32767.0)
+    np.rint(data, out=data)
+    np.clip(data, -32768.0, 32767.0, out=data)
+    return data.astype(np.int16)
+
+
+def _remix_int16(data: np.ndarray, target_channels: int) -> np.ndarray:
+    mix = _channel_mix_matrix(int(data.shape[1]), int(target_channels))
+    mixed = data.astype(np.float32) @ mix
+    np.rint(mixed, out=mixed)
+    np.clip(mixed, -32768.0, 32767.0, out=mixed)
+    return mixed.astype(np.int16)
+
+
+def _read_pcm(stream) -> np.ndarray:
+    itemsize = np.dtype(np.int16).itemsize
+    buf = np.empty(_PCM_INITIAL_SAMPLES, dtype=np.int16)
+    filled = 0
+    while True:
+        view = memoryview(buf).cast("B")
+        while filled < len(view):
+            n = stream.readinto(view[filled:filled + _PIPE_BUFSIZE])
+            if not n:
+                return buf[: filled // itemsize]
+            filled += n
+
+        # Out of room: double, so long tracks cost O(log n) copies.
+        grown = np.empty(buf.size * 2, dtype=np.int16)
+        grown[: buf.size] = buf
+        buf = grown
+
+
+def _load_channel_major(path: str, target_sr: int, target_channels: int) -> tuple[np.ndarray, int]:
+    global _decode_cache_bytes
+
+    try:
+        st = os.stat(path)
+        key = (os.path.abspath(path), st.st_mtime_ns, st.st_size, int(target_sr), int(target_channels))
+    except OSError:
+        key = None
+
+    if key is not None:
+        with _DECODE_CACHE_LOCK:
+            hit = _DECODE_CACHE.get(key)
+            if hit is not None:
+                _DECODE_CACHE.move_to_end(key)
+                return hit
+
+    audio, sr = _load_any_audio_ffmpeg(path, target_sr=target_sr, target_channels=target_channels)
+    audio_ch = np.ascontiguousarray(audio.T)
+    del audio
+    audio_ch.flags.writeable = False
+
+    if key is not None and audio_ch.nbytes <= _DECODE_CACHE_MAX_BYTES:
+        with _DECODE_CACHE_LOCK:
+            old = _DECODE_CACHE.pop(key, None)
+            if old is not None:
+                _decode_cache_bytes -= old[0].nbytes
+            _DECODE_CACHE[key] = (audio_ch, int(sr))
+            _decode_cache_bytes += audio_ch.nbytes
+            while _decode_cache_bytes > _DECODE_CACHE_MAX_BYTES:
+                _, (evicted, _) = _DECODE_CACHE.popitem(last=False)
+                _decode_cache_bytes -= evicted.nbytes
+
+    return audio_ch, int(sr)
 
 
 class RealTimeAudioEngine:
     def __init__(self, blocksize: int = 1024, target_sr: int = 48000, target_channels: int = 2):
         self.blocksize = int(blocksize)
+        self._max_process_size = max(self.blocksize, _MAX_PROCESS_FRAMES)
         self.target_sr = int(target_sr)
         self.target_channels = int(target_channels)
 
         self._lock = threading.RLock()
 
         self._track: Optional[TrackInfo] = None
-        self._audio: Optional[np.ndarray] = None
+        # Channel-major (channels, frames) int16, the layout RubberBand consumes;
+        # converted to float32 a block at a time as it is fed.
+        self._audio_ch: Optional[np.ndarray] = None
         self._sr: int = self.target_sr
         self._ch: int = self.target_channels
 
@@ -91,44 +254,79 @@ class RealTimeAudioEngine:
         self._in_pos = 0
 
         self._stretcher: Optional[RubberBandStretcher] = None
+        self._stretcher_fmt: tuple[int, int] = (0, 0)
+        self._rb_in: Optional[np.ndarray] = None
+        self._rb_skip = 0
+        self._st_available: Callable[[], int] = _no_frames
+        self._st_retrieve: Callable[[int], Optional[np.ndarray]] = _no_output
 
         self._tempo = 1.0
         self._pitch_semitones = 0.0
         self._volume = 1.0
+        self._volume_f32 = np.float32(self._volume)
+
+        self._eof = False
+
+        # Single-producer/single-consumer ring between the producer thread and the
+        # audio callback. Counters only grow; the callback owns _ring_r, the producer
+        # owns _ring_w, and _ring_flush tells the callback to drop everything before it.
+        self._ring = np.zeros((self.blocksize * _RING_BLOCKS, self._ch), dtype=np.float32)
+        self._ring_w = 0
+        self._ring_r = 0
+        self._ring_flush = 0
 
-        self._outq: deque[np.ndarray] = deque()
-        self._outq_frames: int = 0
+        self._producer: Optional[threading.Thread] = None
+        self._producer_stop = False
+        self._wake = threading.Event()
 
+        # The audio callback must not touch the filesystem, so errors are queued
+        # and written out by a writer thread started with playback. The queue is
+        # bounded; when a callback error storm fills it, further errors are dropped.
+        self._log_q: queue.Queue = queue.Queue(maxsize=_LOG_QUEUE_MAX)
+        self._log_writer: Optional[threading.Thread] = None
 
     def load(self, path: str) -> TrackInfo:
-        audio, sr = _load_any_audio_ffmpeg(path, target_sr=self.target_sr, target_channels=self.target_channels)
+        audio_ch, sr = _load_channel_major(path, self.target_sr, self.target_channels)
 
         with self._lock:
-            self._audio = audio
+            self._audio_ch = audio_ch
             self._sr = int(sr)
-            self._ch = int(audio.shape[1])
-
-            self._in_pos = 0
-            self._clear_outq_locked()
-
-            dur_s = float(len(audio) / self._sr) if self._sr > 0 else 0.0
-            self._track = TrackInfo(path=path, duration_s=dur_s, sample_rate=self._sr, channels=self._ch)
-
+            self._ch = int(audio_ch.shape[0])
             self._playing = False
             self._paused = False
 
-            self._build_stretcher_locked()
+            if self._ring.shape[1] != self._ch:
+                self._ring = np.zeros((self.blocksize * _RING_BLOCKS, self._ch), dtype=np.float32)
+
+            self._in_pos = 0
+            self._clear_output_locked()
+
+            frames = int(audio_ch.shape[1])
+            dur_s = float(frames / self._sr) if self._sr > 0 else 0.0
+            self._track = TrackInfo(
+                path=path,
+                duration_s=dur_s,
+                sample_rate=self._sr,
+                channels=self._ch,
+                frames=frames,
+            )
+
+            self._reset_stretcher_locked()
 
         return self._track
 
     def play(self) -> None:
         with self._lock:
-            if self._audio is None:
+            if self._audio_ch is None:
                 return
-            if self._stream is None:
-                self._open_stream_locked()
             self._playing = True
             self._paused = False
+            self._fill_ring_locked()
+            if self._producer is None:
+                self._start_producer_locked()
+            if self._stream is None:
+                self._open_stream_locked()
+        self._wake.set()
 
     def pause(self) -> None:
         with self._lock:
@@ -139,42 +337,52 @@ class RealTimeAudioEngine:
         with self._lock:
             if self._playing:
                 self._paused = False
+        self._wake.set()
 
     def stop(self) -> None:
         with self._lock:
             self._playing = False
             self._paused = False
             self._in_pos = 0
-            self._clear_outq_locked()
-            self._build_stretcher_locked()
+            self._clear_output_locked()
+            self._reset_stretcher_locked()
 
     def seek(self, pos_s: float) -> None:
         with self._lock:
-            if self._audio is None:
+            if self._audio_ch is None or self._track is None:
                 return
             pos_s = float(max(0.0, pos_s))
             new_in_pos = int(pos_s * self._sr)
-            new_in_pos = max(0, min(new_in_pos, len(self._audio)))
+            new_in_pos = max(0, min(new_in_pos, self._track.frames))
 
             self._in_pos = new_in_pos
-            self._clear_outq_locked()
-            self._build_stretcher_locked()
+            self._clear_output_locked()
+            self._reset_stretcher_locked()
+            self._fill_ring_locked()
+        self._wake.set()
 
     def set_pitch_semitones(self, semitones: float) -> None:
+        semitones = float(semitones)
         with self._lock:
-            self._pitch_semitones = float(semitones)
+            if semitones == self._pitch_semitones:
+                return
+            self._pitch_semitones = semitones
             if self._stretcher is not None:
                 self._stretcher.pitch_scale = 2.0 ** (self._pitch_semitones / 12.0)
 
     def set_tempo(self, tempo: float) -> None:
+        tempo = float(max(0.25, min(4.0, tempo)))
         with self._lock:
-            self._tempo = float(max(0.25, min(4.0, tempo)))
+            if tempo == self._tempo:
+                return
+            self._tempo = tempo
             if self._stretcher is not None:
                 self._stretcher.time_ratio = 1.0 / max(1e-6, self._tempo)
 
     def set_volume(self, v: float) -> None:
         with self._lock:
             self._volume = float(max(0.0, min(1.0, v)))
+            self._volume_f32 = np.float32(self._volume)
 
     def is_playing(self) -> bool:
         with self._lock:
@@ -186,7 +394,7 @@ class RealTimeAudioEngine:
 
     def is_loaded(self) -> bool:
         with self._lock:
-            return self._audio is not None
+            return self._audio_ch is not None
 
     def get_track(self) -> Optional[TrackInfo]:
         with self._lock:
@@ -194,14 +402,39 @@ class RealTimeAudioEngine:
 
     def get_pos_s(self) -> float:
         with self._lock:
-            if self._sr <= 0:
-                return 0.0
-            return float(self._in_pos) / float(self._sr)
+            return self._audible_pos_s_locked()
+
+    def snapshot(self) -> tuple[float, bool, bool]:
+        with self._lock:
+            return self._audible_pos_s_locked(), self._playing, self._paused
+
+    def _audible_pos_s_locked(self) -> float:
+        if self._sr <= 0:
+            return 0.0
+        # _in_pos counts input handed to the stretcher; output still waiting in the
+        # stretcher or the ring hasn't been heard yet. Map it back to input frames.
+        pending_out = self._ring_w - max(self._ring_r, self._ring_flush)
+        st = self._stretcher
+        if st is not None:
+            try:
+                pending_out += max(0, int(self._st_available()))
+            except Exception:
+                pass
+        pos = float(self._in_pos) - max(0, pending_out) * self._tempo
+        return max(0.0, pos) / float(self._sr)
 
     def shutdown(self) -> None:
         with self._lock:
             self._playing = False
             self._paused = False
+            self._producer_stop = True
+            producer = self._producer
+            self._producer = None
+        self._wake.set()
+        if producer is not None:
+            producer.join(timeout=1.0)
+
+        with self._lock:
             if self._stream is not None:
                 try:
                     self._stream.stop()
@@ -212,18 +445,175 @@ class RealTimeAudioEngine:
                 except Exception:
                     pass
                 self._stream = None
+            writer = self._log_writer
+            self._log_writer = None
+
+        if writer is not None:
+            # Sentinel: the writer drains what's queued, closes its file and exits.
+            try:
+                self._log_q.put(None, timeout=1.0)
+            except queue.Full:
+                pass
+            writer.join(timeout=1.0)
 
 
-    def _log_rt_error(self, msg: str) -> None:
+    def _log_rt_error(self, err: str | BaseException) -> None:
         try:
-            with open("rt_audio_errors.log", "a", encoding="utf-8") as f:
-                f.write(msg + "\n")
-        except Exception:
+            self._log_q.put_nowait(err)
+        except queue.Full:
             pass
 
-    def _clear_outq_locked(self) -> None:
-        self._outq.clear()
-        self._outq_frames = 0
+    def _start_log_writer_locked(self) -> None:
+        if self._log_writer is not None:
+            return
+        self._log_writer = threading.Thread(
+            target=self._log_writer_loop, name="rt-audio-log", daemon=True
+        )
+        self._log_writer.start()
+
+    def _log_writer_loop(self) -> None:
+        f = None
+        try:
+            while True:
+                err = self._log_q.get()
+                if err is None:
+                    return
+                try:
+                    if isinstance(err, BaseException):
+                        err = "".join(traceback.format_exception(err))
+                    if f is None:
+                        f = open("rt_audio_errors.log", "a", encoding="utf-8")
+                    f.write(err.rstrip("\n") + "\n")
+                    f.flush()
+                except Exception:
+                    pass
+        finally:
+            if f is not None:
+                try:
+                    f.close()
+                except Exception:
+                    pass
+
+    def _clear_output_locked(self) -> None:
+        self._eof = False
+        self._ring_flush = self._ring_w
+
+    def _start_producer_locked(self) -> None:
+        self._start_log_writer_locked()
+        self._producer_stop = False
+        self._producer = threading.Thread(
+            target=self._producer_loop, name="rt-audio-producer", daemon=True
+        )
+        self._producer.start()
+
+    def _producer_loop(self) -> None:
+        while not self._producer_stop:
+            # Clear before looking at the state so a play()/unpause()/seek() racing
+            # with this pass still wakes the wait below.
+            self._wake.clear()
+            try:
+                with self._lock:
+                    produced = self._fill_ring_locked()
+                    idle = (not self._playing) or self._paused or self._audio_ch is None
+            except Exception:
+                produced = False
+                idle = False
+                self._log_rt_error(traceback.format_exc())
+            if produced:
+                continue
+            if idle:
+                # Nothing to render until playback resumes; don't poll the lock.
+                self._wake.wait()
+            else:
+                self._wake.wait(_PRODUCER_IDLE_S)
+
+    def _fill_ring_locked(self) -> bool:
+        audio_ch = self._audio_ch
+        st = self._stretcher
+        if (not self._playing) or self._paused or audio_ch is None or st is None:
+            return False
+
+        size = self._ring.shape[0]
+        buffered = self._ring_w - max(self._ring_r, self._ring_flush)
+        free = size - buffered
+
+        available = self._st_available
+        retrieve = self._st_retrieve
+
+        if self._eof and available() <= 0:
+            if buffered <= 0:
+                self._playing = False
+                self._paused = False
+            return False
+
+        blocksize = self.blocksize
+        if free < blocksize:
+            return False
+
+        total_in = audio_ch.shape[1]
+        max_batch = self._max_process_size
+        in_pos = self._in_pos
+        produced = 0
+        safety_iters = 0
+
+        try:
+            while free > 0 and safety_iters < 24:
+                safety_iters += 1
+
+                avail = available()
+                if avail > 0 and self._rb_skip > 0:
+                    drop = min(avail, self._rb_skip)
+                    retrieve(drop)
+                    self._rb_skip -= drop
+                    continue
+                if avail > 0:
+                    rb_out = retrieve(min(avail, free))
+                    if rb_out is None:
+                        break
+                    out = self._from_rb_locked(rb_out)
+                    n_out = out.shape[0]
+                    if n_out == 0:
+                        break
+                    self._write_ring_locked(out)
+                    free -= n_out
+                    produced += n_out
+                    continue
+
+                # Feed a whole max-size batch while the ring is empty (startup, post-seek)
+                # so output appears after one process() call instead of several.
+                in_n = min(max_batch if free == size else blocksize, total_in - in_pos)
+                if in_n <= 0:
+                    self._eof = True
+                    break
+
+                rb_in = self._rb_block_locked(in_n)
+                np.multiply(audio_ch[:, in_pos:in_pos + in_n], _INT16_SCALE, out=rb_in, casting="unsafe")
+                in_pos += in_n
+
+                st.process(rb_in)
+        finally:
+            self._in_pos = in_pos
+
+        return produced > 0
+
+    def _rb_block_locked(self, n: int) -> np.ndarray:
+        # Contiguous (channels, n) view over the front of the scratch buffer, so
+        # partial blocks don't make the binding copy a strided slice.
+        rb_in = self._rb_in
+        if n == rb_in.shape[1]:
+            return rb_in
+        return rb_in.reshape(-1)[: self._ch * n].reshape(self._ch, n)
+
+    def _write_ring_locked(self, data: np.ndarray) -> None:
+        ring = self._ring
+        size = ring.shape[0]
+        n = int(data.shape[0])
+        start = self._ring_w % size
+        first = min(n, size - start)
+        ring[start:start + first] = data[:first]
+        if first < n:
+            ring[:n - first] = data[first:]
+        self._ring_w += n
 
     def _open_stream_locked(self) -> None:
         self._stream = sd.OutputStream(
@@ -236,6 +626,35 @@ class RealTimeAudioEngine:
         )
         self._stream.start()
 
+    def _reset_stretcher_locked(self) -> None:
+        reused = False
+        if self._stretcher is not None and self._stretcher_fmt == (self._sr, self._ch):
+            try:
+                self._stretcher.reset()
+                reused = True
+            except Exception:
+                pass
+        if not reused:
+            self._build_stretcher_locked()
+        self._prime_stretcher_locked()
+
+    def _prime_stretcher_locked(self) -> None:
+        # Feed RubberBand its preferred lead-in of silence and drop the matching
+        # start delay from its output, so the first retrieved frame is input frame 0.
+        st = self._stretcher
+        try:
+            pad = int(st.get_preferred_start_pad())
+            delay = int(st.get_start_delay())
+        except Exception:
+            pad = delay = 0
+
+        self._rb_in.fill(0.0)
+        while pad > 0:
+            n = min(pad, self._max_process_size)
+            st.process(self._rb_block_locked(n))
+            pad -= n
+        self._rb_skip = delay
+
     def _build_stretcher_locked(self) -> None:
         opts = (
             Option.PROCESS_REALTIME
@@ -243,7 +662,7 @@ class RealTimeAudioEngine:
             | Option.CHANNELS_TOGETHER
             | Option.PHASE_LAMINAR
             | Option.SMOOTHING_ON
-            | Option.WINDOW_STANDARD
+            | Option.WINDOW_SHORT
             | Option.TRANSIENTS_MIXED
             | Option.THREADING_AUTO
         )
@@ -257,7 +676,7 @@ class RealTimeAudioEngine:
             )
 
         try:
-            st.set_max_process_size(self.blocksize) 
+            st.set_max_process_size(self._max_process_size)
         except Exception:
             pass
 
@@ -277,38 +696,9 @@ class RealTimeAudioEngine:
             pass
 
         self._stretcher = st
-
-    def _get_available_frames_locked(self) -> int:
-        st = self._stretcher
-        if st is None:
-            return 0
-        for name in ("available", "available_samples", "get_available", "get_samples_available"):
-            if hasattr(st, name):
-                try:
-                    return int(getattr(st, name)())
-                except Exception:
-                    return 0
-        return 0
-
-    def _retrieve_locked(self, n: int) -> Optional[np.ndarray]:
-        st = self._stretcher
-        if st is None:
-            return None
-
-        candidates = (
-            ("retrieve", (n,)),
-            ("retrieve_samples", (n,)),
-            ("retrieve_available", tuple()),
-            ("retrieve_available_samples", tuple()),
-        )
-
-        for name, args in candidates:
-            if hasattr(st, name):
-                try:
-                    return getattr(st, name)(*args)
-                except Exception:
-                    return None
-        return None
+        self._stretcher_fmt = (self._sr, self._ch)
+        self._st_available, self._st_retrieve = _resolve_stretcher_io(st)
+        self._rb_in = pylibrb.create_audio_array(self._ch, self._max_process_size)
 
     def _from_rb_locked(self, rb_out: np.ndarray) -> np.ndarray:
         arr = np.asarray(rb_out)
@@ -316,88 +706,69 @@ class RealTimeAudioEngine:
             arr = arr.T
         elif arr.ndim == 1:
             arr = arr.reshape((-1, 1))
-        return np.ascontiguousarray(arr, dtype=np.float32)
-
-    def _append_out_locked(self, out: np.ndarray) -> None:
-        if out is None or out.size == 0:
-            return
-        out = np.ascontiguousarray(out, dtype=np.float32)
-        self._outq.append(out)
-        self._outq_frames += int(out.shape[0])
-
-    def _ensure_outq_locked(self, frames_needed: int) -> None:
-        if self._audio is None or self._stretcher is None:
-            return
+        return arr
 
-        target = frames_needed + (self.blocksize * 2)
-        safety_iters = 0
-
-        while self._outq_frames < target and safety_iters < 24:
-            safety_iters += 1
-
-            remaining = len(self._audio) - self._in_pos
-            in_n = min(self.blocksize, remaining)
-
-            if in_n <= 0:
-                avail = self._get_available_frames_locked()
-                if avail > 0:
-                    rb_out = self._retrieve_locked(avail)
-                    if rb_out is not None:
-                        out = self._from_rb_locked(rb_out)
-                        self._append_out_locked(out)
-                    continue
-                self._playing = False
-                self._paused = False
+    def _callback(self, outdata, frames, time_info, status):
+        try:
+            r = max(self._ring_r, self._ring_flush)
+            if (not self._playing) or self._paused:
+                self._ring_r = r
+                outdata[:] = 0
                 return
 
-            in_chunk = self._audio[self._in_pos:self._in_pos + in_n]
-            self._in_pos += in_n
-            in_chunk = np.ascontiguousarray(in_chunk, dtype=np.float32)
+            ring = self._ring
+            size = ring.shape[0]
+            take = min(frames, self._ring_w - r)
+            volume = self._volume_f32
 
-            rb_in = pylibrb.create_audio_array(int(self._ch), int(in_n))
-            rb_in[:, :] = in_chunk.T
+            if take > 0:
+                start = r % size
+                first = min(take, size - start)
+                np.multiply(ring[start:start + first], volume, out=outdata[:first])
+                if first < take:
+                    np.multiply(ring[:take - first], volume, out=outdata[first:take])
+            if take < frames:
+                outdata[take:].fill(0)
 
-            self._stretcher.process(rb_in)
+            self._ring_r = r + take
 
-            avail = self._get_available_frames_locked()
-            if avail > 0:
-                rb_out = self._retrieve_locked(avail)
-                if rb_out is not None:
-                    out = self._from_rb_locked(rb_out)
-                    self._append_out_locked(out)
+        except Exception:
+            outdata[:] = 0
+            self._log_rt_error(sys.exc_info()[1])
 
-    def _callback(self, outdata, frames, time_info, status):
-        try:
-            with self._lock:
-                if (not self._playing) or self._paused or self._audio is None or self._stretcher is None:
-                    outdata[:] = 0
-                    return
+def _no_frames() -> int:
+    return 0
 
-                self._ensure_outq_locked(frames)
 
-                outdata[:] = 0
-                need = frames
-                written = 0
+def _no_output(n: int) -> Optional[np.ndarray]:
+    return None
 
-                while need > 0 and self._outq_frames > 0:
-                    chunk = self._outq[0]
-                    take = min(need, int(chunk.shape[0]))
 
-                    outdata[written:written + take] = chunk[:take] * self._volume
+def _resolve_stretcher_io(
+    st: RubberBandStretcher,
+) -> tuple[Callable[[], int], Callable[[int], Optional[np.ndarray]]]:
+    available: Callable[[], int] = _no_frames
+    for name in ("available", "available_samples", "get_available", "get_samples_available"):
+        if hasattr(st, name):
+            available = getattr(st, name)
+            break
 
-                    if take == chunk.shape[0]:
-                        self._outq.popleft()
-                    else:
-                        self._outq[0] = chunk[take:]
+    retrieve: Callable[[int], Optional[np.ndarray]] = _no_output
+    for name in ("retrieve", "retrieve_samples"):
+        if hasattr(st, name):
+            retrieve = getattr(st, name)
+            break
+    else:
+        for name in ("retrieve_available", "retrieve_available_samples"):
+            if hasattr(st, name):
+                fn = getattr(st, name)
+                retrieve = lambda n, fn=fn: fn()
+                break
 
-                    self._outq_frames -= take
-                    written += take
-                    need -= take
+    return available, retrieve
 
-        except Exception:
-            outdata[:] = 0
-            self._log_rt_error(traceback.format_exc())
 
+@functools.lru_cache(maxsize=1)
 def _ffmpeg_exe() -> str:
     if getattr(sys, "frozen", False):
         base = getattr(sys, "_MEIPASS", os.path.dirname(sys.executable))
@@ -0,0 +1,111 @@
+import dataclasses
+import os
+import pickle
+import sqlite3
+import threading
+from typing import Any
+
+from core.app_dirs import user_cache_dir
+
+
+_DB_NAME = "tags.sqlite3"
+_SCHEMA_VERSION = 2
+
+COVER_UNKNOWN = 0
+COVER_ABSENT = 1
+COVER_PRESENT = 2
+
+_lock = threading.Lock()
+_conn: sqlite3.Connection | None = None
+
+
+def get(path: str) -> Any | None:
+    key = _stat_key(path)
+    if key is None:
+        return None
+    abs_path, mtime_ns, size = key
+
+    try:
+        with _lock:
+            row = _connect().execute(
+                "SELECT mtime_ns, size, cover_state, bundle, cover FROM tags WHERE path = ?",
+                (abs_path,),
+            ).fetchone()
+    except (sqlite3.Error, OSError):
+        return None
+
+    if row is None or row[0] != mtime_ns or row[1] != size:
+        return None
+    if row[2] == COVER_UNKNOWN:
+        return None
+
+    try:
+        bundle = pickle.loads(row[3])
+    except Exception:
+        return None
+    return dataclasses.replace(bundle, cover=row[4] if row[2] == COVER_PRESENT else None)
+
+
+def put(path: str, bundle: Any) -> None:
+    key = _stat_key(path)
+    if key is None:
+        return
+    abs_path, mtime_ns, size = key
+
+    try:
+        blob = pickle.dumps(dataclasses.replace(bundle, cover=None), pickle.HIGHEST_PROTOCOL)
+        cover = bundle.cover if bundle.cover_state == COVER_PRESENT else None
+        with _lock:
+            conn = _connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO tags (path, mtime_ns, size, cover_state, bundle, cover) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (abs_path, mtime_ns, size, bundle.cover_state, blob, cover),
+            )
+            conn.commit()
+    except (sqlite3.Error, OSError, pickle.PicklingError):
+        pass
+
+
+def flush_cache() -> None:
+    try:
+        with _lock:
+            conn = _connect()
+            conn.execute("DELETE FROM tags")
+            conn.commit()
+    except (sqlite3.Error, OSError):
+        pass
+
+
+def _connect() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        conn = sqlite3.connect(
+            os.path.join(user_cache_dir(), _DB_NAME),
+            check_same_thread=False,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS tags")
+            conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS tags ("
+            "path TEXT PRIMARY KEY, "
+            "mtime_ns INTEGER NOT NULL, "
+            "size INTEGER NOT NULL, "
+            "cover_state INTEGER NOT NULL, "
+            "bundle BLOB NOT NULL, "
+            "cover BLOB)"
+        )
+        conn.commit()
+        _conn = conn
+    return _conn
+
+
+def _stat_key(path: str) -> tuple[str, int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return os.path.abspath(path), st.st_mtime_ns, st.st_size
@@ -1,9 +1,14 @@
+import sys
+
 from core.rt_audio_engine import RealTimeAudioEngine
 from controllers.player_controller import PlayerController
 from ui.main_window import MainWindow
 
 
 def main():
+    # The audio callback still runs Python and needs the GIL; a shorter switch
+    # interval bounds how long the UI or producer thread can hold it off.
+    sys.setswitchinterval(0.001)
     engine = RealTimeAudioEngine(blocksize=2048)
     controller = PlayerController(engine)
     app = MainWindow(controller)
@@ -1,11 +1,208 @@
+import hashlib
 import io
+import os
 import tkinter as tk
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from tkinter import filedialog, messagebox, ttk
+from types import MappingProxyType
 
 from PIL import Image, ImageTk
 
+from core.app_dirs import user_cache_dir
+
+
+_COVER_POLL_MS = 15
+_META_POLL_MS = 30
+_COVER_CACHE_MAX = 32
+_FX_APPLY_MS = 120
+_VOLUME_FLUSH_MS = 20
+_COVER_REDUCING_GAP = 2.0
+
+_TEXT_INPUT_CLASSES = frozenset(
+    {"Entry", "TEntry", "Text", "Spinbox", "TSpinbox", "Combobox", "TCombobox"}
+)
+
+_PALETTE = MappingProxyType({
+    "app_bg": "#000000",
+    "card_bg": "#0a0a0a",
+    "cover_bg": "#141414",
+    "text": "#f3f4f6",
+    "muted": "#a3a3a3",
+    "primary_btn": "#242424",
+    "primary_btn_active": "#323232",
+    "soft_btn": "#1c1c1c",
+    "soft_btn_active": "#2a2a2a",
+    "play_bg": "#1f1f1f",
+    "play_fg": "#d7dbe2",
+    "pause_bg": "#292929",
+    "pause_fg": "#c6c9cf",
+    "stop_bg": "#222222",
+    "stop_fg": "#d1d5db",
+    "value_bg": "#080808",
+    "scale_trough": "#2b2b2b",
+    "timeline_knob": "#6b7280",
+    "timeline_knob_active": "#7d8696",
+    "volume_knob": "#52525b",
+    "volume_knob_active": "#656573",
+    "scale_border": "#3a3a3a",
+})
+
+# ttk style table; "{key}" strings are filled from _PALETTE.
+_STYLE_SPEC = (
+    ("App.TFrame", {"background": "{app_bg}"}),
+    ("Card.TFrame", {"background": "{card_bg}"}),
+    ("Cover.TFrame", {"background": "{cover_bg}"}),
+    # Card-scoped base label style; the "*.Card.TLabel" styles below inherit from it
+    # and only override what differs. The global TLabel (used by Tk's own dialogs)
+    # is left alone.
+    (
+        "Card.TLabel",
+        {"background": "{card_bg}", "foreground": "{muted}", "font": ("Segoe UI", 10)},
+    ),
+    ("HeaderTitle.Card.TLabel", {"foreground": "{text}", "font": ("Segoe UI Semibold", 18)}),
+    ("SectionTitle.Card.TLabel", {"foreground": "{text}", "font": ("Segoe UI Semibold", 12)}),
+    ("TrackTitle.Card.TLabel", {"foreground": "{text}", "font": ("Segoe UI Semibold", 22)}),
+    ("Meta.Card.TLabel", {"font": ("Segoe UI", 11)}),
+    ("Mono.Card.TLabel", {"foreground": "{text}", "font": ("Consolas", 11)}),
+    ("Cover.Card.TLabel", {"background": "{cover_bg}"}),
+    (
+        "Value.Card.TLabel",
+        {
+            "background": "{value_bg}",
+            "foreground": "{text}",
+            "padding": (10, 4),
+            "font": ("Consolas", 11),
+        },
+    ),
+    (
+        "BadgeStop.Card.TLabel",
+        {
+            "background": "{stop_bg}",
+            "foreground": "{stop_fg}",
+            "padding": (12, 3),
+            "font": ("Segoe UI Semibold", 9),
+        },
+    ),
+    (
+        "BadgePlaying.Card.TLabel",
+        {
+            "background": "{play_bg}",
+            "foreground": "{play_fg}",
+            "padding": (12, 3),
+            "font": ("Segoe UI Semibold", 9),
+        },
+    ),
+    (
+        "BadgePaused.Card.TLabel",
+        {
+            "background": "{pause_bg}",
+            "foreground": "{pause_fg}",
+            "padding": (12, 3),
+            "font": ("Segoe UI Semibold", 9),
+        },
+    ),
+    (
+        "PrimaryMuted.TButton",
+        {
+            "background": "{primary_btn}",
+            "foreground": "{text}",
+            "borderwidth": 0,
+            "focusthickness": 0,
+            "padding": (16, 8),
+            "font": ("Segoe UI Semibold", 10),
+        },
+    ),
+    (
+        "Soft.TButton",
+        {
+            "background": "{soft_btn}",
+            "foreground": "{text}",
+            "borderwidth": 0,
+            "focusthickness": 0,
+            "padding": (12, 8),
+            "font": ("Segoe UI", 10),
+        },
+    ),
+    (
+        "Timeline.Horizontal.TScale",
+        {
+            "background": "{timeline_knob}",
+            "troughcolor": "{scale_trough}",
+            "bordercolor": "{scale_border}",
+            "lightcolor": "{timeline_knob_active}",
+            "darkcolor": "{scale_border}",
+        },
+    ),
+    (
+        "Volume.Horizontal.TScale",
+        {
+            "background": "{volume_knob}",
+            "troughcolor": "{scale_trough}",
+            "bordercolor": "{scale_border}",
+            "lightcolor": "{volume_knob_active}",
+            "darkcolor": "{scale_border}",
+        },
+    ),
+)
+
+_STYLE_MAPS = (
+    (
+        "PrimaryMuted.TButton",
+        {
+            "background": [
+                ("pressed", "{primary_btn_active}"),
+                ("active", "{primary_btn_active}"),
+                ("disabled", "#161616"),
+            ],
+            "foreground": [("disabled", "#676767")],
+        },
+    ),
+    (
+        "Soft.TButton",
+        {
+            "background": [
+                ("pressed", "{soft_btn_active}"),
+                ("active", "{soft_btn_active}"),
+                ("disabled", "#101010"),
+            ],
+            "foreground": [("disabled", "#666666")],
+        },
+    ),
+    (
+        "Timeline.Horizontal.TScale",
+        {"background": [("active", "{timeline_knob_active}"), ("disabled", "#2b2b2b")]},
+    ),
+    (
+        "Volume.Horizontal.TScale",
+        {"background": [("active", "{volume_knob_active}"), ("disabled", "#2b2b2b")]},
+    ),
+)
+
+
+def _resolve_style(value, palette):
+    if isinstance(value, str):
+        return value.format_map(palette)
+    if isinstance(value, dict):
+        return {key: _resolve_style(item, palette) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_resolve_style(item, palette) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_resolve_style(item, palette) for item in value)
+    return value
+
+
+_RESOLVED_STYLE_SPEC = _resolve_style(_STYLE_SPEC, _PALETTE)
+_RESOLVED_STYLE_MAPS = _resolve_style(_STYLE_MAPS, _PALETTE)
+
+
 
 class MainWindow(tk.Tk):
+    _COVER_RESAMPLE = Image.Resampling.BILINEAR if hasattr(Image, "Resampling") else Image.BILINEAR
+    _TEMPO_FMT = "{:.2f}x".format
+    _PITCH_FMT = "{:+.0f} st".format
+
     def __init__(self, controller):
         super().__init__()
         self.controller = controller
@@ -14,8 +211,8 @@ class MainWindow(tk.Tk):
         self.geometry("900x640")
         self.minsize(760, 560)
 
-        self._ignore_scale = False
         self._scrubbing = False
+        self._scrub_after = None
 
         self._tempo_step = 0.02
         self._pitch_step = 1.0
@@ -26,8 +223,30 @@ class MainWindow(tk.Tk):
         self._pitch_max = 12.0
 
         self._cover_imgtk = None
+        self._cover_shown = False
+        self._cover_key = None
+        self._cover_size = (160, 160)
+        self._cover_source_img = None
+        self._cover_bytes = None
+        self._cover_cache = OrderedDict()
+        self._cover_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cover")
+        self._cover_future = None
+        self._meta_version = self.controller.state.meta_version
+        self._view_version = None
+        self._last_ui = {}
+        self._scale_to = None
+        self._scale_pos_int = None
+        self._time_view = None
+        self._last_vol_pct = None
+        self._engine_after_id = None
+        self._view_after_id = None
+        self._window_hidden = False
         self._volume_dragging = False
-        self._shortcut_tag = "PlayerShortcuts"
+        self._vol_after = None
+        self._pending_tempo = None
+        self._pending_pitch = None
+        self._fx_after = None
+        self._enabled_state = None
 
         self._build_styles()
         self._build_ui()
@@ -36,33 +255,13 @@ class MainWindow(tk.Tk):
         self.focus_set()
 
         self.protocol("WM_DELETE_WINDOW", self._on_close)
-        self._tick_ui()
+        self.bind("<Unmap>", self._on_window_unmap, add="+")
+        self.bind("<Map>", self._on_window_map, add="+")
+        self._engine_tick()
+        self._view_refresh()
 
     def _build_styles(self):
-        self._palette = {
-            "app_bg": "#000000",
-            "card_bg": "#0a0a0a",
-            "cover_bg": "#141414",
-            "text": "#f3f4f6",
-            "muted": "#a3a3a3",
-            "primary_btn": "#242424",
-            "primary_btn_active": "#323232",
-            "soft_btn": "#1c1c1c",
-            "soft_btn_active": "#2a2a2a",
-            "play_bg": "#1f1f1f",
-            "play_fg": "#d7dbe2",
-            "pause_bg": "#292929",
-            "pause_fg": "#c6c9cf",
-            "stop_bg": "#222222",
-            "stop_fg": "#d1d5db",
-            "value_bg": "#080808",
-            "scale_trough": "#2b2b2b",
-            "timeline_knob": "#6b7280",
-            "timeline_knob_active": "#7d8696",
-            "volume_knob": "#52525b",
-            "volume_knob_active": "#656573",
-            "scale_border": "#3a3a3a",
-        }
+        self._palette = _PALETTE
 
         self.configure(bg=self._palette["app_bg"])
         style = ttk.Style(self)
@@ -71,153 +270,10 @@ class MainWindow(tk.Tk):
         except tk.TclError:
             pass
 
-        style.configure("App.TFrame", background=self._palette["app_bg"])
-        style.configure("Card.TFrame", background=self._palette["card_bg"])
-        style.configure("Cover.TFrame", background=self._palette["cover_bg"])
-
-        style.configure(
-            "HeaderTitle.TLabel",
-            background=self._palette["card_bg"],
-            foreground=self._palette["text"],
-            font=("Segoe UI Semibold", 18),
-        )
-        style.configure(
-            "HeaderSub.TLabel",
-            background=self._palette["card_bg"],
-            foreground=self._palette["muted"],
-            font=("Segoe UI", 10),
-        )
-        style.configure(
-            "SectionTitle.TLabel",
-            background=self._palette["card_bg"],
-            foreground=self._palette["text"],
-            font=("Segoe UI Semibold", 12),
-        )
-        style.configure(
-            "TrackTitle.TLabel",
-            background=self._palette["card_bg"],
-            foreground=self._palette["text"],
-            font=("Segoe UI Semibold", 22),
-        )
-        style.configure(
-            "Meta.TLabel",
-            background=self._palette["card_bg"],
-            foreground=self._palette["muted"],
-            font=("Segoe UI", 11),
-        )
-        style.configure(
-            "Muted.TLabel",
-            background=self._palette["card_bg"],
-            foreground=self._palette["muted"],
-            font=("Segoe UI", 10),
-        )
-        style.configure(
-            "Mono.TLabel",
-            background=self._palette["card_bg"],
-            foreground=self._palette["text"],
-            font=("Consolas", 11),
-        )
-        style.configure(
-            "Cover.TLabel",
-            background=self._palette["cover_bg"],
-            foreground=self._palette["muted"],
-            font=("Segoe UI", 10),
-        )
-        style.configure(
-            "Value.TLabel",
-            background=self._palette["value_bg"],
-            foreground=self._palette["text"],
-            padding=(10, 4),
-            font=("Consolas", 11),
-        )
-        style.configure(
-            "BadgeStop.TLabel",
-            background=self._palette["stop_bg"],
-            foreground=self._palette["stop_fg"],
-            padding=(12, 3),
-            font=("Segoe UI Semibold", 9),
-        )
-        style.configure(
-            "BadgePlaying.TLabel",
-            background=self._palette["play_bg"],
-            foreground=self._palette["play_fg"],
-            padding=(12, 3),
-            font=("Segoe UI Semibold", 9),
-        )
-        style.configure(
-            "BadgePaused.TLabel",
-            background=self._palette["pause_bg"],
-            foreground=self._palette["pause_fg"],
-            padding=(12, 3),
-            font=("Segoe UI Semibold", 9),
-        )
-
-        style.configure(
-            "PrimaryMuted.TButton",
-            background=self._palette["primary_btn"],
-            foreground=self._palette["text"],
-            borderwidth=0,
-            focusthickness=0,
-            padding=(16, 8),
-            font=("Segoe UI Semibold", 10),
-        )
-        style.map(
-            "PrimaryMuted.TButton",
-            background=[
-                ("pressed", self._palette["primary_btn_active"]),
-                ("active", self._palette["primary_btn_active"]),
-                ("disabled", "#161616"),
-            ],
-            foreground=[("disabled", "#676767")],
-        )
-        style.configure(
-            "Soft.TButton",
-            background=self._palette["soft_btn"],
-            foreground=self._palette["text"],
-            borderwidth=0,
-            focusthickness=0,
-            padding=(12, 8),
-            font=("Segoe UI", 10),
-        )
-        style.map(
-            "Soft.TButton",
-            background=[
-                ("pressed", self._palette["soft_btn_active"]),
-                ("active", self._palette["soft_btn_active"]),
-                ("disabled", "#101010"),
-            ],
-            foreground=[("disabled", "#666666")],
-        )
-        style.configure(
-            "Timeline.Horizontal.TScale",
-            background=self._palette["timeline_knob"],
-            troughcolor=self._palette["scale_trough"],
-            bordercolor=self._palette["scale_border"],
-            lightcolor=self._palette["timeline_knob_active"],
-            darkcolor=self._palette["scale_border"],
-        )
-        style.map(
-            "Timeline.Horizontal.TScale",
-            background=[
-                ("active", self._palette["timeline_knob_active"]),
-                ("disabled", "#2b2b2b"),
-            ],
-        )
-        style.configure(
-            "Volume.Horizontal.TScale",
-            background=self._palette["volume_knob"],
-            troughcolor=self._palette["scale_trough"],
-            bordercolor=self._palette["scale_border"],
-            lightcolor=self._palette["volume_knob_active"],
-            darkcolor=self._palette["scale_border"],
-        )
-        style.map(
-            "Volume.Horizontal.TScale",
-            background=[
-                ("active", self._palette["volume_knob_active"]),
-                ("disabled", "#2b2b2b"),
-            ],
-        )
+        for name, options in _RESOLVED_STYLE_SPEC:
+            style.configure(name, **options)
+        for name, options in _RESOLVED_STYLE_MAPS:
+            style.map(name, **options)
 
     def _build_ui(self):
         root = ttk.Frame(self, style="App.TFrame", padding=18)
@@ -228,13 +284,13 @@ class MainWindow(tk.Tk):
         header.grid(row=0, column=0, sticky="ew")
         header.columnconfigure(0, weight=1)
 
-        ttk.Label(header, text="Offline Music Player", style="HeaderTitle.TLabel").grid(
+        ttk.Label(header, text="Offline Music Player", style="HeaderTitle.Card.TLabel").grid(
             row=0, column=0, sticky="w"
         )
         self.lbl_header_hint = ttk.Label(
             header,
             text="Load a track to start listening.",
-            style="HeaderSub.TLabel",
+            style="HeaderSub.Card.TLabel",
         )
         self.lbl_header_hint.grid(row=1, column=0, sticky="w", pady=(4, 0))
 
@@ -250,25 +306,27 @@ class MainWindow(tk.Tk):
         cover_shell = ttk.Frame(now_playing, style="Cover.TFrame", width=170, height=170)
         cover_shell.grid(row=0, column=0, rowspan=3, sticky="nsw", padx=(0, 18))
         cover_shell.grid_propagate(False)
+        cover_shell.bind("<Configure>", self._on_cover_shell_configure)
 
         self.cover_label = ttk.Label(
             cover_shell,
             text="No cover art",
-            style="Cover.TLabel",
+            style="Cover.Card.TLabel",
             anchor="center",
             justify="center",
         )
         self.cover_label.place(relx=0.5, rely=0.5, anchor="center")
+        self._cover_imgtk = ImageTk.PhotoImage(Image.new("RGB", self._cover_size, _PALETTE["cover_bg"]))
 
         self.lbl_track_title = ttk.Label(
-            now_playing, text="No file loaded", style="TrackTitle.TLabel"
+            now_playing, text="No file loaded", style="TrackTitle.Card.TLabel"
         )
         self.lbl_track_title.grid(row=0, column=1, sticky="w")
 
         self.lbl_track_meta = ttk.Label(
             now_playing,
             text="Artist and album metadata appears here.",
-            style="Meta.TLabel",
+            style="Meta.Card.TLabel",
         )
         self.lbl_track_meta.grid(row=1, column=1, sticky="w", pady=(4, 0))
 
@@ -277,39 +335,43 @@ class MainWindow(tk.Tk):
         status_row.columnconfigure(1, weight=1)
 
         self.lbl_playback_state = ttk.Label(
-            status_row, text="Stopped", style="BadgeStop.TLabel"
+            status_row, text="Stopped", style="BadgeStop.Card.TLabel"
         )
         self.lbl_playback_state.grid(row=0, column=0, sticky="w")
 
-        self.status_label = ttk.Label(status_row, text="", style="Muted.TLabel")
+        self.status_label = ttk.Label(status_row, text="", style="Muted.Card.TLabel")
         self.status_label.grid(row=0, column=1, sticky="e")
 
         timeline = ttk.Frame(root, style="Card.TFrame", padding=(18, 14))
         timeline.grid(row=2, column=0, sticky="ew", pady=(12, 0))
         timeline.columnconfigure(1, weight=1)
 
-        self.lbl_left = ttk.Label(timeline, text="00:00", style="Mono.TLabel")
+        self.lbl_left = ttk.Label(timeline, text="00:00", style="Mono.Card.TLabel")
         self.lbl_left.grid(row=0, column=0, sticky="w")
 
+        # Position goes through a Tcl variable; the scale has no command, so
+        # programmatic updates never round-trip into Python.
+        self._pos_var = tk.DoubleVar(self, value=0.0)
         self.scale = ttk.Scale(
             timeline,
             from_=0,
             to=100,
             orient="horizontal",
-            command=self._on_scale_move,
+            variable=self._pos_var,
             style="Timeline.Horizontal.TScale",
         )
         self.scale.grid(row=0, column=1, sticky="ew", padx=12)
 
-        self.lbl_right = ttk.Label(timeline, text="00:00", style="Mono.TLabel")
+        self.lbl_right = ttk.Label(timeline, text="00:00", style="Mono.Card.TLabel")
         self.lbl_right.grid(row=0, column=2, sticky="e")
 
         self.lbl_remaining = ttk.Label(
-            timeline, text="Remaining 00:00", style="Muted.TLabel"
+            timeline, text="Remaining 00:00", style="Muted.Card.TLabel"
         )
         self.lbl_remaining.grid(row=1, column=1, sticky="e", pady=(6, 0))
 
         self.scale.bind("<ButtonPress-1>", self._on_scrub_start)
+        self.scale.bind("<B1-Motion>", self._on_scrub_motion)
         self.scale.bind("<ButtonRelease-1>", self._on_scrub_end)
 
         bottom = ttk.Frame(root, style="App.TFrame")
@@ -321,14 +383,14 @@ class MainWindow(tk.Tk):
         controls.grid(row=0, column=0, sticky="nsew", padx=(0, 8))
         controls.columnconfigure(0, weight=1)
 
-        ttk.Label(controls, text="Playback", style="SectionTitle.TLabel").grid(
+        ttk.Label(controls, text="Playback", style="SectionTitle.Card.TLabel").grid(
             row=0, column=0, sticky="w"
         )
         play_row = ttk.Frame(controls, style="Card.TFrame")
         play_row.grid(row=1, column=0, sticky="w", pady=(10, 0))
 
         self.btn_back = ttk.Button(
-            play_row, text="-5s", style="Soft.TButton", command=lambda: self._skip(-5.0)
+            play_row, text="-5s", style="Soft.TButton", command=partial(self._skip, -5.0)
         )
         self.btn_back.grid(row=0, column=0, padx=(0, 8))
 
@@ -338,7 +400,7 @@ class MainWindow(tk.Tk):
         self.btn_play_pause.grid(row=0, column=1, padx=(0, 8))
 
         self.btn_forward = ttk.Button(
-            play_row, text="+5s", style="Soft.TButton", command=lambda: self._skip(5.0)
+            play_row, text="+5s", style="Soft.TButton", command=partial(self._skip, 5.0)
         )
         self.btn_forward.grid(row=0, column=2)
 
@@ -346,12 +408,16 @@ class MainWindow(tk.Tk):
         volume_row.grid(row=2, column=0, sticky="ew", pady=(16, 0))
         volume_row.columnconfigure(1, weight=1)
 
-        ttk.Label(volume_row, text="Volume", style="Muted.TLabel").grid(row=0, column=0, sticky="w")
+        ttk.Label(volume_row, text="Volume", style="Muted.Card.TLabel").grid(
+            row=0, column=0, sticky="w"
+        )
 
+        self._vol_lo = 0.0
+        self._vol_hi = 1.0
         self.vol = ttk.Scale(
             volume_row,
-            from_=0.0,
-            to=1.0,
+            from_=self._vol_lo,
+            to=self._vol_hi,
             orient="horizontal",
             command=self._on_volume,
             style="Volume.Horizontal.TScale",
@@ -359,16 +425,17 @@ class MainWindow(tk.Tk):
         self.vol.grid(row=0, column=1, sticky="ew", padx=10)
         self.vol.bind("<ButtonPress-1>", self._on_volume_press, add="+")
         self.vol.bind("<ButtonRelease-1>", self._on_volume_release, add="+")
-        self.vol.set(self.controller.state.volume)
-        self.controller.set_volume(self.controller.state.volume)
+        volume = self.controller.state.volume
+        self.vol.set(volume)
+        self.controller.set_volume(volume)
 
-        self.lbl_volume = ttk.Label(volume_row, text="30%", style="Mono.TLabel")
+        self.lbl_volume = ttk.Label(volume_row, text="30%", style="Mono.Card.TLabel")
         self.lbl_volume.grid(row=0, column=2, sticky="e")
 
         ttk.Label(
             controls,
             text="Shortcuts: Space play/pause, Left/Right seek, Ctrl+Left/Right tempo, Up/Down pitch",
-            style="Muted.TLabel",
+            style="Muted.Card.TLabel",
         ).grid(row=3, column=0, sticky="w", pady=(12, 0))
 
         fx = ttk.Frame(bottom, style="Card.TFrame", padding=18)
@@ -378,14 +445,14 @@ class MainWindow(tk.Tk):
         fx_header = ttk.Frame(fx, style="Card.TFrame")
         fx_header.grid(row=0, column=0, sticky="ew")
         fx_header.columnconfigure(0, weight=1)
-        ttk.Label(fx_header, text="Playback Effects", style="SectionTitle.TLabel").grid(
+        ttk.Label(fx_header, text="Playback Effects", style="SectionTitle.Card.TLabel").grid(
             row=0, column=0, sticky="w"
         )
 
         tempo_row = ttk.Frame(fx, style="Card.TFrame")
         tempo_row.grid(row=1, column=0, sticky="ew", pady=(12, 6))
 
-        ttk.Label(tempo_row, text="Tempo", style="Muted.TLabel").pack(side="left")
+        ttk.Label(tempo_row, text="Tempo", style="Muted.Card.TLabel").pack(side="left")
         self.btn_reset_tempo = ttk.Button(
             tempo_row,
             text="Reset",
@@ -398,7 +465,7 @@ class MainWindow(tk.Tk):
             text="-",
             style="Soft.TButton",
             width=3,
-            command=lambda: self._nudge_tempo(-1),
+            command=partial(self._nudge_tempo, -1),
         )
         self.btn_tempo_down.pack(side="right", padx=(0, 6))
         self.btn_tempo_up = ttk.Button(
@@ -406,16 +473,16 @@ class MainWindow(tk.Tk):
             text="+",
             style="Soft.TButton",
             width=3,
-            command=lambda: self._nudge_tempo(+1),
+            command=partial(self._nudge_tempo, +1),
         )
         self.btn_tempo_up.pack(side="right", padx=(0, 6))
-        self.tempo_display = ttk.Label(tempo_row, text="1.00x", width=8, style="Value.TLabel")
+        self.tempo_display = ttk.Label(tempo_row, text="1.00x", width=8, style="Value.Card.TLabel")
         self.tempo_display.pack(side="right")
 
         pitch_row = ttk.Frame(fx, style="Card.TFrame")
         pitch_row.grid(row=2, column=0, sticky="ew", pady=(6, 0))
 
-        ttk.Label(pitch_row, text="Pitch", style="Muted.TLabel").pack(side="left")
+        ttk.Label(pitch_row, text="Pitch", style="Muted.Card.TLabel").pack(side="left")
         self.btn_reset_pitch = ttk.Button(
             pitch_row,
             text="Reset",
@@ -428,7 +495,7 @@ class MainWindow(tk.Tk):
             text="-",
             style="Soft.TButton",
             width=3,
-            command=lambda: self._nudge_pitch(-1),
+            command=partial(self._nudge_pitch, -1),
         )
         self.btn_pitch_down.pack(side="right", padx=(0, 6))
         self.btn_pitch_up = ttk.Button(
@@ -436,84 +503,162 @@ class MainWindow(tk.Tk):
             text="+",
             style="Soft.TButton",
             width=3,
-            command=lambda: self._nudge_pitch(+1),
+            command=partial(self._nudge_pitch, +1),
         )
         self.btn_pitch_up.pack(side="right", padx=(0, 6))
-        self.pitch_display = ttk.Label(pitch_row, text="+0 st", width=8, style="Value.TLabel")
+        self.pitch_display = ttk.Label(pitch_row, text="+0 st", width=8, style="Value.Card.TLabel")
         self.pitch_display.pack(side="right")
 
-    def _bind_shortcuts(self):
-        self.bind_class(self._shortcut_tag, "<KeyPress-space>", self._on_space_shortcut, add="+")
-        self._install_shortcut_tag(self)
-        self.bind("<Left>", lambda _e: self._skip(-5.0))
-        self.bind("<Right>", lambda _e: self._skip(5.0))
-        self.bind("<Control-Left>", lambda _e: self._nudge_tempo(-1))
-        self.bind("<Control-Right>", lambda _e: self._nudge_tempo(+1))
-        self.bind("<Down>", lambda _e: self._nudge_pitch(-1))
-        self.bind("<Up>", lambda _e: self._nudge_pitch(+1))
-
-    def _install_shortcut_tag(self, widget):
-        try:
-            tags = list(widget.bindtags())
-        except Exception:
-            return
-
-        if self._shortcut_tag not in tags:
-            insert_at = 1 if len(tags) > 1 else len(tags)
-            tags.insert(insert_at, self._shortcut_tag)
-            widget.bindtags(tuple(tags))
+        self._toggleable = (
+            self.btn_play_pause,
+            self.btn_back,
+            self.btn_forward,
+            self.btn_reset_tempo,
+            self.btn_reset_pitch,
+            self.btn_tempo_down,
+            self.btn_tempo_up,
+            self.btn_pitch_down,
+            self.btn_pitch_up,
+            self.scale,
+            self.vol,
+        )
 
-        for child in widget.winfo_children():
-            self._install_shortcut_tag(child)
+    def _bind_shortcuts(self):
+        self.bind_all("<KeyPress-space>", self._on_space_shortcut, add="+")
+        # ttk buttons invoke themselves on space from their class binding. An instance
+        # binding runs first, so this window's buttons play/pause instead, while
+        # buttons elsewhere (file dialog, message boxes) keep the default.
+        for widget in (self.btn_open, *self._toggleable):
+            widget.bind("<KeyPress-space>", self._on_space_shortcut)
+        self.bind("<Left>", partial(_call_ignoring_event, self._skip, -5.0))
+        self.bind("<Right>", partial(_call_ignoring_event, self._skip, 5.0))
+        self.bind("<Control-Left>", partial(_call_ignoring_event, self._nudge_tempo, -1))
+        self.bind("<Control-Right>", partial(_call_ignoring_event, self._nudge_tempo, +1))
+        self.bind("<Down>", partial(_call_ignoring_event, self._nudge_pitch, -1))
+        self.bind("<Up>", partial(_call_ignoring_event, self._nudge_pitch, +1))
 
     def _on_space_shortcut(self, event):
-        cls = str(event.widget.winfo_class()) if event.widget is not None else ""
-        if cls in {"Entry", "TEntry", "Text", "Spinbox", "TSpinbox", "Combobox", "TCombobox"}:
+        widget = event.widget
+        # Widgets created on the Tcl side (e.g. the native file dialog) arrive as strings.
+        if not isinstance(widget, tk.Misc) or widget.winfo_toplevel() is not self:
+            return None
+        if widget.winfo_class() in _TEXT_INPUT_CLASSES:
             return None
 
         self._play_pause()
         return "break"
 
     def _apply_enabled(self, enabled: bool):
-        state = "normal" if enabled else "disabled"
-        self.btn_play_pause.configure(state=state)
-        self.btn_back.configure(state=state)
-        self.btn_forward.configure(state=state)
-        self.btn_reset_tempo.configure(state=state)
-        self.btn_reset_pitch.configure(state=state)
-        self.btn_tempo_down.configure(state=state)
-        self.btn_tempo_up.configure(state=state)
-        self.btn_pitch_down.configure(state=state)
-        self.btn_pitch_up.configure(state=state)
-        self.scale.state(["!disabled"] if enabled else ["disabled"])
-        self.vol.state(["!disabled"] if enabled else ["disabled"])
+        if enabled == self._enabled_state:
+            return
+        self._enabled_state = enabled
+        state_spec = ("!disabled",) if enabled else ("disabled",)
+        for widget in self._toggleable:
+            widget.state(state_spec)
 
     @staticmethod
     def _fmt_time(seconds: float) -> str:
-        seconds = max(0, int(seconds))
-        m, s = divmod(seconds, 60)
-        return f"{m:02d}:{s:02d}"
+        return _fmt_time_int(max(0, int(seconds)))
 
     def _set_cover_art(self, cover_bytes: bytes | None):
+        key = hashlib.blake2b(cover_bytes, digest_size=16).digest() if cover_bytes else None
+        if key == self._cover_key:
+            return
+        self._cover_key = key
+
         if not cover_bytes:
-            self.cover_label.configure(image="", text="No cover art")
-            self._cover_imgtk = None
+            self._cancel_cover_future()
+            self._hide_cover("No cover art")
+            return
+
+        self._cover_source_img = None
+        self._cover_bytes = cover_bytes
+        if self._show_cached_cover():
+            return
+        # Decode and resize on the worker; PhotoImage has to be built on the Tk thread.
+        self._submit_cover(_decode_cover, cover_bytes, key=key)
+
+    def _submit_cover(self, fn, source, **kwargs):
+        self._cancel_cover_future()
+        future = self._cover_pool.submit(
+            fn, source, self._cover_size, self._COVER_RESAMPLE, **kwargs
+        )
+        self._cover_future = future
+        self.after(_COVER_POLL_MS, self._finish_cover, future, (self._cover_key, self._cover_size))
+
+    def _cancel_cover_future(self):
+        # A superseded job that hasn't started yet is dropped instead of decoded for nothing.
+        future = self._cover_future
+        self._cover_future = None
+        if future is not None:
+            future.cancel()
+
+    def _show_cached_cover(self) -> bool:
+        # Composited frames are small, so keep recent ones and skip decode + resize on reopen.
+        cache_key = (self._cover_key, self._cover_size)
+        frame = self._cover_cache.get(cache_key)
+        if frame is None:
+            return False
+        self._cover_cache.move_to_end(cache_key)
+        self._cancel_cover_future()
+        self._show_cover_frame(frame)
+        return True
+
+    def _on_cover_shell_configure(self, event):
+        size = (max(1, event.width - 10), max(1, event.height - 10))
+        if size == self._cover_size:
             return
+        self._cover_size = size
+        if self._cover_bytes is None or self._show_cached_cover():
+            return
+        source = self._cover_source_img
+        # A draft-decoded source may be too small for a larger area; decode again then.
+        if source is not None and (source.width >= size[0] or source.height >= size[1]):
+            self._submit_cover(_resize_cover, source)
+        else:
+            self._submit_cover(_decode_cover, self._cover_bytes, key=self._cover_key)
+
+    def _finish_cover(self, future, cache_key):
+        if future is not self._cover_future:
+            return
+        if not future.done():
+            self.after(_COVER_POLL_MS, self._finish_cover, future, cache_key)
+            return
+        self._cover_future = None
 
         try:
-            img = Image.open(io.BytesIO(cover_bytes))
-            if img.mode not in ("RGB", "RGBA"):
-                img = img.convert("RGB")
+            source, frame = future.result()
+            self._show_cover_frame(frame)
+            self._cover_source_img = source
+        except Exception:
+            self._hide_cover("Cover art unreadable")
+            return
 
-            resample = Image.Resampling.LANCZOS if hasattr(Image, "Resampling") else Image.LANCZOS
-            img.thumbnail((160, 160), resample)
-            imgtk = ImageTk.PhotoImage(img)
+        self._cover_cache[cache_key] = frame
+        self._cover_cache.move_to_end(cache_key)
+        if len(self._cover_cache) > _COVER_CACHE_MAX:
+            self._cover_cache.popitem(last=False)
+
+    def _show_cover_frame(self, frame):
+        # Paste into the existing PhotoImage when the size allows, rather than
+        # allocating a new Tk image for every cover.
+        imgtk = self._cover_imgtk
+        if imgtk is not None and (imgtk.width(), imgtk.height()) == frame.size:
+            imgtk.paste(frame)
+        else:
+            imgtk = ImageTk.PhotoImage(frame)
+            self._cover_imgtk = imgtk
+            self._cover_shown = False
 
+        if not self._cover_shown:
             self.cover_label.configure(image=imgtk, text="")
-            self._cover_imgtk = imgtk
-        except Exception:
-            self.cover_label.configure(image="", text="Cover art unreadable")
-            self._cover_imgtk = None
+            self._cover_shown = True
+
+    def _hide_cover(self, text: str):
+        self.cover_label.configure(image="", text=text)
+        self._cover_shown = False
+        self._cover_source_img = None
+        self._cover_bytes = None
 
     def _open(self):
         path = filedialog.askopenfilename(
@@ -526,6 +671,15 @@ class MainWindow(tk.Tk):
         if not path:
             return
 
+        st = self.controller.state
+        if st.is_loaded and path == st.path:
+            # Same track: keep the loaded audio, cover and widgets; just make it play.
+            if not st.is_playing or st.is_paused:
+                self.controller.play()
+                self._update_playback_state(st)
+                self._rearm_ticks(st)
+            return
+
         try:
             self.controller.load(path)
         except Exception as e:
@@ -533,50 +687,66 @@ class MainWindow(tk.Tk):
             return
 
         st = self.controller.state
-        self._update_track_details(st)
-        self.lbl_right.configure(text=self._fmt_time(st.duration_s))
-        self.lbl_left.configure(text="00:00")
-        self.lbl_remaining.configure(text=f"Remaining {self._fmt_time(st.duration_s)}")
-        self._set_cover_art(st.cover_bytes)
-        self._update_fx_display(st)
-        self._update_playback_state(st)
-
-        self._ignore_scale = True
-        self.scale.configure(from_=0, to=max(st.duration_s, 1.0))
-        self.scale.set(0)
-        self._ignore_scale = False
-
-        self.vol.set(st.volume)
-        self._refresh_volume_label(st.volume)
-        self._apply_enabled(True)
+        # Tk redraws at idle anyway; flush once here so the whole reset lands in one
+        # layout pass right away, even if a step below raises.
+        try:
+            self._meta_version = st.meta_version
+            self._update_track_details(st)
+            self._set_text(self.lbl_right, self._fmt_time(st.duration_s))
+            self._set_text(self.lbl_left, "00:00")
+            self._set_text(self.lbl_remaining, f"Remaining {self._fmt_time(st.duration_s)}")
+            self._set_cover_art(st.cover_bytes)
+            self._update_fx_display(st)
+            self._update_playback_state(st)
+
+            self._scale_to = max(st.duration_s, 1.0)
+            self.scale.configure(from_=0, to=self._scale_to)
+            self._pos_var.set(0.0)
+            self._scale_pos_int = 0
+            self._time_view = None
+
+            self.vol.set(st.volume)
+            self._refresh_volume_label(st.volume)
+            self._apply_enabled(True)
+        finally:
+            self.update_idletasks()
+        self._rearm_ticks(st)
 
     def _play_pause(self):
-        if not self.controller.state.is_loaded:
+        st = self.controller.state
+        if not st.is_loaded:
             return
         self.controller.toggle_play_pause()
-        self._update_playback_state(self.controller.state)
+        self._update_playback_state(st)
+        self._rearm_ticks(st)
 
     def _skip(self, delta_s: float):
-        if not self.controller.state.is_loaded:
+        st = self.controller.state
+        if not st.is_loaded:
             return
         self.controller.skip(delta_s)
         if not self._scrubbing:
-            st = self.controller.state
-            self.lbl_left.configure(text=self._fmt_time(st.pos_s))
-            self._ignore_scale = True
-            self.scale.set(st.pos_s)
-            self._ignore_scale = False
+            self._set_text(self.lbl_left, self._fmt_time(st.pos_s))
+            self._pos_var.set(st.pos_s)
+            self._scale_pos_int = int(st.pos_s)
+            self._time_view = None
 
     def _on_volume(self, _):
+        # Throttle a drag's burst of slider callbacks to one update per 20 ms; the
+        # flush reads the slider, so it always applies the latest position.
+        if self._vol_after is None:
+            self._vol_after = self.after(_VOLUME_FLUSH_MS, self._flush_volume)
+
+    def _flush_volume(self):
+        self._vol_after = None
         level = float(self.vol.get())
         self.controller.set_volume(level)
         self._refresh_volume_label(level)
 
     def _on_volume_press(self, event):
-        element = ""
         try:
             element = self.vol.identify(event.x, event.y) or ""
-        except Exception:
+        except tk.TclError:
             element = ""
 
         # Accept direct knob grabs only; ignore trough clicks to avoid hard snaps.
@@ -592,10 +762,13 @@ class MainWindow(tk.Tk):
 
     def _on_volume_release(self, _event):
         self._volume_dragging = False
+        if self._vol_after is not None:
+            self.after_cancel(self._vol_after)
+            self._flush_volume()
 
     def _volume_to_x(self, value: float) -> int:
-        lo = float(self.vol.cget("from"))
-        hi = float(self.vol.cget("to"))
+        lo = self._vol_lo
+        hi = self._vol_hi
         width = max(1, int(self.vol.winfo_width()))
         span = hi - lo
         if span <= 0:
@@ -605,89 +778,208 @@ class MainWindow(tk.Tk):
         return int(round(ratio * width))
 
     def _refresh_volume_label(self, level: float):
-        self.lbl_volume.configure(text=f"{int(round(level * 100)):d}%")
+        pct = int(round(level * 100))
+        if pct == self._last_vol_pct:
+            return
+        self._last_vol_pct = pct
+        self.lbl_volume.configure(text=f"{pct:d}%")
 
     def _on_scrub_start(self, _evt):
         if not self.controller.state.is_loaded:
             return
         self._scrubbing = True
+        self._scale_pos_int = None
+        self._time_view = None
 
-    def _on_scale_move(self, _value):
-        if self._ignore_scale:
-            return
+    def _on_scrub_motion(self, _evt):
+        # Trailing throttle: at most one label update per 33 ms, always showing the
+        # latest position (the class binding moves the scale after this handler).
+        if self._scrubbing and self._scrub_after is None:
+            self._scrub_after = self.after(33, self._refresh_scrub_label)
+
+    def _refresh_scrub_label(self):
+        self._scrub_after = None
         if self._scrubbing:
-            self.lbl_left.configure(text=self._fmt_time(float(self.scale.get())))
+            self._set_text(self.lbl_left, self._fmt_time(self._pos_var.get()))
 
     def _on_scrub_end(self, _evt):
-        if not self.controller.state.is_loaded:
+        st = self.controller.state
+        if not st.is_loaded:
             return
         self._scrubbing = False
-        self.controller.seek(float(self.scale.get()))
-        self._update_playback_state(self.controller.state)
+        self.controller.seek(self._pos_var.get())
+        self._update_playback_state(st)
 
-    def _tick_ui(self):
+    def _engine_tick(self):
+        self._engine_after_id = None
         self.controller.tick()
+        if not self._window_hidden:
+            self._schedule_engine_tick(self._engine_interval_ms(self.controller.state))
+
+    def _view_refresh(self):
+        self._view_after_id = None
         st = self.controller.state
 
-        self._update_playback_state(st)
-        self._update_fx_display(st)
-        self._refresh_volume_label(st.volume)
+        if st.meta_version != self._meta_version:
+            self._meta_version = st.meta_version
+            self._update_track_details(st)
+            self._set_cover_art(st.cover_bytes)
+
+        if st.view_version != self._view_version:
+            self._view_version = st.view_version
+            self._update_playback_state(st)
+            self._update_fx_display(st)
+            self._refresh_volume_label(st.volume)
 
         if st.is_loaded and not self._scrubbing:
-            self.lbl_left.configure(text=self._fmt_time(st.pos_s))
-            self.lbl_right.configure(text=self._fmt_time(st.duration_s))
-            remaining = max(0.0, st.duration_s - st.pos_s)
-            self.lbl_remaining.configure(text=f"Remaining {self._fmt_time(remaining)}")
+            pos_s = st.pos_s
+            duration_s = st.duration_s
+            # The labels only show whole seconds; skip them until one of those changes.
+            pos_int = int(pos_s)
+            time_view = (pos_int, int(duration_s), int(max(0.0, duration_s - pos_s)))
+            if time_view != self._time_view:
+                self._time_view = time_view
+                self._set_text(self.lbl_left, self._fmt_time(pos_s))
+                self._set_text(self.lbl_right, self._fmt_time(duration_s))
+                self._set_text(self.lbl_remaining, f"Remaining {self._fmt_time(time_view[2])}")
+
+            scale_to = max(duration_s, 1.0)
+            if scale_to != self._scale_to:
+                self._scale_to = scale_to
+                self.scale.configure(to=scale_to)
+            if pos_int != self._scale_pos_int:
+                self._scale_pos_int = pos_int
+                self._pos_var.set(pos_s)
+
+        if not self._window_hidden:
+            self._schedule_view_refresh(self._view_interval_ms(st))
 
-            self._ignore_scale = True
-            self.scale.configure(to=max(st.duration_s, 1.0))
-            self.scale.set(st.pos_s)
-            self._ignore_scale = False
+    @staticmethod
+    def _engine_interval_ms(st) -> int:
+        return 100 if (st.is_playing and not st.is_paused) else 1000
 
-        self.after(150, self._tick_ui)
+    @staticmethod
+    def _view_interval_ms(st) -> int:
+        # Tags and cover arrive from the controller's loader thread; pick them up promptly.
+        if st.meta_pending:
+            return _META_POLL_MS
+        return 250 if (st.is_playing and not st.is_paused) else 1000
+
+    def _schedule_engine_tick(self, delay_ms: int):
+        if self._engine_after_id is not None:
+            self.after_cancel(self._engine_after_id)
+        self._engine_after_id = self.after(delay_ms, self._engine_tick)
+
+    def _schedule_view_refresh(self, delay_ms: int):
+        if self._view_after_id is not None:
+            self.after_cancel(self._view_after_id)
+        self._view_after_id = self.after(delay_ms, self._view_refresh)
+
+    def _rearm_ticks(self, st):
+        self._schedule_engine_tick(self._engine_interval_ms(st))
+        self._schedule_view_refresh(self._view_interval_ms(st))
+
+    def _on_window_unmap(self, event):
+        if event.widget is not self:
+            return
+        self._window_hidden = True
+        for after_id in (self._engine_after_id, self._view_after_id):
+            if after_id is not None:
+                self.after_cancel(after_id)
+        self._engine_after_id = None
+        self._view_after_id = None
+
+    def _on_window_map(self, event):
+        if event.widget is not self or not self._window_hidden:
+            return
+        self._window_hidden = False
+        self._schedule_engine_tick(0)
+        self._schedule_view_refresh(0)
 
     def _on_close(self):
         try:
+            for after_id in (
+                self._engine_after_id,
+                self._view_after_id,
+                self._vol_after,
+                self._fx_after,
+                self._scrub_after,
+            ):
+                if after_id is not None:
+                    self.after_cancel(after_id)
+            self._engine_after_id = self._view_after_id = None
+            self._vol_after = self._fx_after = self._scrub_after = None
+            self._cancel_cover_future()
+            self._cover_pool.shutdown(wait=False, cancel_futures=True)
             self.controller.shutdown()
         finally:
             self.destroy()
 
     def _nudge_tempo(self, direction: int):
-        if not self.controller.state.is_loaded:
-            return
-
         st = self.controller.state
-        new_t = st.tempo + (direction * self._tempo_step)
-        new_t = max(self._tempo_min, min(self._tempo_max, new_t))
+        if not st.is_loaded:
+            return
 
-        self.controller.set_tempo(new_t)
-        self._update_fx_display(self.controller.state)
+        tempo = st.tempo if self._pending_tempo is None else self._pending_tempo
+        new_t = tempo + (direction * self._tempo_step)
+        lo, hi = self._tempo_min, self._tempo_max
+        self._pending_tempo = lo if new_t < lo else hi if new_t > hi else new_t
+        self._schedule_fx_apply()
+        self._update_fx_display(st)
 
     def _nudge_pitch(self, direction: int):
-        if not self.controller.state.is_loaded:
+        st = self.controller.state
+        if not st.is_loaded:
             return
 
-        st = self.controller.state
-        new_p = st.semitones + (direction * self._pitch_step)
-        new_p = max(self._pitch_min, min(self._pitch_max, new_p))
+        semitones = st.semitones if self._pending_pitch is None else self._pending_pitch
+        new_p = semitones + (direction * self._pitch_step)
+        lo, hi = self._pitch_min, self._pitch_max
+        self._pending_pitch = lo if new_p < lo else hi if new_p > hi else new_p
+        self._schedule_fx_apply()
+        self._update_fx_display(st)
 
-        self.controller.set_semitones(new_p)
+    def _schedule_fx_apply(self):
+        # Held arrow keys repeat far faster than the stretcher needs retuning;
+        # apply whatever the latest target is once per interval.
+        if self._fx_after is None:
+            self._fx_after = self.after(_FX_APPLY_MS, self._apply_pending_fx)
+
+    def _apply_pending_fx(self):
+        self._fx_after = None
+        if self._pending_tempo is not None:
+            self.controller.set_tempo(self._pending_tempo)
+            self._pending_tempo = None
+        if self._pending_pitch is not None:
+            self.controller.set_semitones(self._pending_pitch)
+            self._pending_pitch = None
         self._update_fx_display(self.controller.state)
 
     def _reset_tempo(self):
-        if not self.controller.state.is_loaded:
+        st = self.controller.state
+        if not st.is_loaded:
             return
+        self._pending_tempo = None
         self.controller.reset_tempo()
-        self._update_fx_display(self.controller.state)
+        self._update_fx_display(st)
 
     def _reset_pitch(self):
-        if not self.controller.state.is_loaded:
+        st = self.controller.state
+        if not st.is_loaded:
             return
+        self._pending_pitch = None
         self.controller.reset_pitch()
-        self._update_fx_display(self.controller.state)
+        self._update_fx_display(st)
+
+    def _set_text(self, widget, text: str):
+        # Skip the Tcl round trip when the label already shows this text.
+        if self._last_ui.get(widget) == text:
+            return
+        self._last_ui[widget] = text
+        widget.configure(text=text)
 
     def _update_track_details(self, st):
-        self.lbl_track_title.configure(text=st.title if st.title else "Unknown track")
+        self._set_text(self.lbl_track_title, st.title if st.title else "Unknown track")
 
         meta_parts = []
         if st.artist:
@@ -696,35 +988,102 @@ class MainWindow(tk.Tk):
             meta_parts.append(st.album)
 
         if meta_parts:
-            self.lbl_track_meta.configure(text=" | ".join(meta_parts))
+            self._set_text(self.lbl_track_meta, " | ".join(meta_parts))
         else:
-            self.lbl_track_meta.configure(text="No artist/album metadata available.")
+            self._set_text(self.lbl_track_meta, "No artist/album metadata available.")
 
-        self.lbl_header_hint.configure(
-            text=f"Track length: {self._fmt_time(st.duration_s)}"
-        )
+        self._set_text(self.lbl_header_hint, f"Track length: {self._fmt_time(st.duration_s)}")
 
     def _update_fx_display(self, st):
-        self.tempo_display.configure(text=f"{st.tempo:.2f}x")
-        sign = "+" if st.semitones >= 0 else ""
-        self.pitch_display.configure(text=f"{sign}{st.semitones:.0f} st")
-        self.status_label.configure(text=st.fx_message or "")
+        tempo = st.tempo if self._pending_tempo is None else self._pending_tempo
+        semitones = st.semitones if self._pending_pitch is None else self._pending_pitch
+        self._set_text(self.tempo_display, self._TEMPO_FMT(tempo))
+        self._set_text(self.pitch_display, self._PITCH_FMT(semitones))
+        self._set_text(self.status_label, st.fx_message or "")
 
     def _update_playback_state(self, st):
+        playing = st.is_playing
+        paused = st.is_paused
         if not st.is_loaded:
-            self.lbl_playback_state.configure(text="Stopped", style="BadgeStop.TLabel")
-            self.btn_play_pause.configure(text="Play")
-            return
+            view = ("Stopped", "BadgeStop.Card.TLabel", "Play")
+        elif playing and not paused:
+            view = ("Playing", "BadgePlaying.Card.TLabel", "Pause")
+        elif playing and paused:
+            view = ("Paused", "BadgePaused.Card.TLabel", "Resume")
+        else:
+            view = ("Ready", "BadgeStop.Card.TLabel", "Play")
 
-        if st.is_playing and not st.is_paused:
-            self.lbl_playback_state.configure(text="Playing", style="BadgePlaying.TLabel")
-            self.btn_play_pause.configure(text="Pause")
+        if self._last_ui.get("playback") == view:
             return
+        self._last_ui["playback"] = view
+        badge_text, badge_style, button_text = view
+        self.lbl_playback_state.configure(text=badge_text, style=badge_style)
+        self.btn_play_pause.configure(text=button_text)
+
+
+def _call_ignoring_event(fn, arg, _event=None):
+    return fn(arg)
 
-        if st.is_playing and st.is_paused:
-            self.lbl_playback_state.configure(text="Paused", style="BadgePaused.TLabel")
-            self.btn_play_pause.configure(text="Resume")
-            return
 
-        self.lbl_playback_state.configure(text="Ready", style="BadgeStop.TLabel")
-        self.btn_play_pause.configure(text="Play")
+@lru_cache(maxsize=4096)
+def _fmt_time_int(seconds: int) -> str:
+    m, s = divmod(seconds, 60)
+    return f"{m:02d}:{s:02d}"
+
+
+def _decode_cover(
+    cover_bytes: bytes, size, resample, key: bytes | None = None
+) -> tuple[Image.Image | None, Image.Image]:
+    thumb_path = _cover_thumb_path(key, size) if key is not None else None
+    if thumb_path is not None:
+        try:
+            with Image.open(thumb_path) as thumb:
+                thumb.load()
+            return None, _letterbox_cover(thumb, size)
+        except Exception:
+            pass
+
+    img = Image.open(io.BytesIO(cover_bytes))
+    if img.format == "JPEG":
+        # Let libjpeg decode at a reduced DCT scale that still covers the target size.
+        img.draft("RGB", size)
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGB")
+    img.load()
+
+    thumb = _fit_cover(img, size, resample)
+    if thumb_path is not None:
+        try:
+            thumb.save(thumb_path, "WEBP", quality=80, method=4)
+        except Exception:
+            pass
+    return img, _letterbox_cover(thumb, size)
+
+
+def _resize_cover(source: Image.Image, size, resample) -> tuple[Image.Image, Image.Image]:
+    return source, _letterbox_cover(_fit_cover(source, size, resample), size)
+
+
+def _fit_cover(img: Image.Image, size, resample) -> Image.Image:
+    # Like thumbnail(), but resizes into a new image instead of copying the
+    # full-size source first; reducing_gap box-reduces before the final filter.
+    scale = min(size[0] / img.width, size[1] / img.height)
+    if scale >= 1.0:
+        return img
+    target = (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+    return img.resize(target, resample, reducing_gap=_COVER_REDUCING_GAP)
+
+
+def _letterbox_cover(thumb: Image.Image, size) -> Image.Image:
+    # Letterbox onto a fixed-size frame so the window's PhotoImage can be reused.
+    frame = Image.new("RGB", size, _PALETTE["cover_bg"])
+    offset = ((size[0] - thumb.width) // 2, (size[1] - thumb.height) // 2)
+    frame.paste(thumb, offset, thumb if thumb.mode == "RGBA" else None)
+    return frame
+
+
+def _cover_thumb_path(key: bytes, size) -> str | None:
+    try:
+        return os.path.join(user_cache_dir("covers"), f"{key.hex()}-{size[0]}x{size[1]}.webp")
+    except OSError:
+        return None